@@ -34,7 +34,7 @@ useradd -m -s /bin/bash pguser
 # Copy SDK to writable location (excluding any existing bin directory with wrong-platform binary)
 mkdir -p /home/pguser/sdk
 cp -r /sdk-src/pg0 /home/pguser/sdk/
-cp /sdk-src/pyproject.toml /sdk-src/hatch_build.py /sdk-src/README.md /home/pguser/sdk/
+cp /sdk-src/pyproject.toml /sdk-src/hatch_build.py /sdk-src/pg0_download.py /sdk-src/README.md /home/pguser/sdk/
 rm -rf /home/pguser/sdk/pg0/bin  # Remove any existing binary
 chown -R pguser:pguser /home/pguser/sdk
 
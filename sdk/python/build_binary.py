@@ -2,21 +2,34 @@
 """
 Build script to download the pg0 binary for the current platform.
 This is run during wheel building to bundle the binary into the package.
+
+For CI staging, PG0_TARGET_PLATFORM=all downloads every platform's binary
+into <staging-dir>/<platform>/, which must be outside the pg0 package:
+
+    PG0_TARGET_PLATFORM=all python build_binary.py <staging-dir>
+
+Wheels bundle everything under pg0/bin/, and the runtime only looks for
+pg0/bin/pg0, so the per-platform binaries must never land there.
 """
 
+import concurrent.futures
+import functools
 import hashlib
 import os
-import platform
-import stat
-import subprocess
+import shutil
 import sys
 import urllib.request
 from pathlib import Path
 
+from pg0_download import READ_DATA_CHUNK, fetch_ranges
+
 # These are updated with each release
 PG0_VERSION = "v0.9.0"
 PG0_REPO = "vectorize-io/pg0"
 
+# Permissions for the installed binary (rwxr-xr-x)
+BINARY_MODE = 0o755
+
 # SHA256 checksums for each binary (updated with each release)
 # To generate: sha256sum pg0-<platform>
 CHECKSUMS = {
@@ -29,10 +42,16 @@ CHECKSUMS = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def get_platform() -> str:
     """Detect the current platform."""
-    system = platform.system().lower()
-    machine = platform.machine().lower()
+    # sys.platform is a constant and os.uname() a single syscall, unlike the
+    # platform module which may shell out to uname.
+    system = {"win32": "windows"}.get(sys.platform, sys.platform)
+    if hasattr(os, "uname"):
+        machine = os.uname().machine.lower()
+    else:
+        machine = os.environ.get("PROCESSOR_ARCHITECTURE", "").lower()
 
     if system == "darwin":
         return "darwin-aarch64"
@@ -44,16 +63,11 @@ def get_platform() -> str:
         else:
             raise RuntimeError(f"Unsupported architecture: {machine}")
 
-        # Detect musl vs glibc
+        # Detect musl vs glibc from the dynamic loader mapped into this process
         try:
-            result = subprocess.run(
-                ["ldd", "--version"],
-                capture_output=True,
-                text=True,
-            )
-            if "musl" in (result.stdout + result.stderr).lower():
+            if "ld-musl" in Path("/proc/self/maps").read_text():
                 return f"linux-{arch}-musl"
-        except FileNotFoundError:
+        except OSError:
             pass
 
         # Check for musl loader
@@ -67,6 +81,27 @@ def get_platform() -> str:
         raise RuntimeError(f"Unsupported platform: {system}")
 
 
+def sha256_file(path: Path) -> str:
+    """Compute the SHA256 of a file without reading it into memory at once."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        while chunk := f.read(1 << 20):
+            h.update(chunk)
+        return h.hexdigest()
+
+
+def fetch_to_file(url: str, dest: Path) -> str:
+    """Stream url into dest and return the SHA256 of the downloaded bytes."""
+    h = hashlib.sha256()
+    with urllib.request.urlopen(url, timeout=120) as response, open(dest, "wb") as out:
+        while chunk := response.read(READ_DATA_CHUNK):
+            out.write(chunk)
+            h.update(chunk)
+    return h.hexdigest()
+
+
 def download_binary(target_dir: Path, plat: str | None = None) -> Path:
     """Download the pg0 binary for the specified platform."""
     if plat is None:
@@ -82,46 +117,71 @@ def download_binary(target_dir: Path, plat: str | None = None) -> Path:
     print(f"Downloading pg0 {PG0_VERSION} for {plat}...")
     print(f"  URL: {url}")
 
-    # Download to temp file first
+    # Download to temp file first. Parts of a ranged download arrive out of
+    # order, so those are hashed afterwards; a single stream is hashed as
+    # it is written.
     tmp_path = binary_path.with_suffix(".tmp")
-    urllib.request.urlretrieve(url, tmp_path)
-
-    # Verify checksum if available
-    expected_checksum = CHECKSUMS.get(plat, "")
-    if expected_checksum:
-        with open(tmp_path, "rb") as f:
-            actual_checksum = hashlib.sha256(f.read()).hexdigest()
-        if actual_checksum != expected_checksum:
-            tmp_path.unlink()
-            raise RuntimeError(
-                f"Checksum mismatch for {plat}!\n"
-                f"  Expected: {expected_checksum}\n"
-                f"  Actual:   {actual_checksum}"
-            )
-        print(f"  Checksum verified: {actual_checksum[:16]}...")
-    else:
-        print("  Warning: No checksum available for verification")
+    try:
+        if fetch_ranges(url, tmp_path):
+            actual_checksum = sha256_file(tmp_path)
+        else:
+            actual_checksum = fetch_to_file(url, tmp_path)
+
+        # Verify checksum if available
+        expected_checksum = CHECKSUMS.get(plat, "")
+        if expected_checksum:
+            if actual_checksum != expected_checksum:
+                raise RuntimeError(
+                    f"Checksum mismatch for {plat}!\n"
+                    f"  Expected: {expected_checksum}\n"
+                    f"  Actual:   {actual_checksum}"
+                )
+            print(f"  Checksum verified: {actual_checksum[:16]}...")
+        else:
+            print("  Warning: No checksum available for verification")
+    except BaseException:
+        # A partial file in pg0/bin would be picked up as a wheel artifact
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     # Move to final location
     tmp_path.rename(binary_path)
 
     # Make executable on Unix
     if not plat.startswith("windows"):
-        binary_path.chmod(binary_path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        os.chmod(binary_path, BINARY_MODE)
 
     print(f"  Saved to: {binary_path}")
     return binary_path
 
 
+def download_all(target_dir: Path) -> list[Path]:
+    """Download the pg0 binary for every platform into target_dir/<platform>/.
+
+    Downloads are network-bound and independent, so they run concurrently.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(CHECKSUMS)) as executor:
+        return list(executor.map(lambda plat: download_binary(target_dir / plat, plat), CHECKSUMS))
+
+
 def main():
     """Download binary for current platform into pg0/bin/."""
     script_dir = Path(__file__).parent
+    package_dir = (script_dir / "pg0").resolve()
     bin_dir = script_dir / "pg0" / "bin"
 
     # Allow overriding platform via environment variable (for CI cross-builds)
     plat = os.environ.get("PG0_TARGET_PLATFORM")
 
-    download_binary(bin_dir, plat)
+    if plat == "all":
+        if len(sys.argv) != 2:
+            sys.exit("usage: PG0_TARGET_PLATFORM=all build_binary.py <staging-dir>")
+        staging_dir = Path(sys.argv[1]).resolve()
+        if staging_dir == package_dir or package_dir in staging_dir.parents:
+            sys.exit(f"Staging directory must be outside the pg0 package: {staging_dir}")
+        download_all(staging_dir)
+    else:
+        download_binary(bin_dir, plat)
     print("Done!")
 
 
@@ -7,25 +7,38 @@ The binary can come from:
 3. GitHub releases - downloads from releases (fallback for sdist installs)
 """
 
+import functools
 import os
-import platform
 import shutil
-import stat
 import subprocess
+import sys
 import urllib.request
 from pathlib import Path
 from typing import Any, Optional
 
 from hatchling.builders.hooks.plugin.interface import BuildHookInterface
 
+# Hatch loads this hook by path, so its directory is not importable by default
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from pg0_download import READ_DATA_CHUNK, fetch_ranges  # noqa: E402
+
 # GitHub repo for downloading releases
 PG0_REPO = "vectorize-io/pg0"
 
+# Permissions for the installed binary (rwxr-xr-x)
+BINARY_MODE = 0o755
+
 
+@functools.lru_cache(maxsize=None)
 def get_platform() -> str:
     """Detect the current platform."""
-    system = platform.system().lower()
-    machine = platform.machine().lower()
+    # sys.platform is a constant and os.uname() a single syscall, unlike the
+    # platform module which may shell out to uname.
+    system = {"win32": "windows"}.get(sys.platform, sys.platform)
+    if hasattr(os, "uname"):
+        machine = os.uname().machine.lower()
+    else:
+        machine = os.environ.get("PROCESSOR_ARCHITECTURE", "").lower()
 
     if system == "darwin":
         return "darwin-aarch64" if machine == "arm64" else "darwin-x86_64"
@@ -37,16 +50,11 @@ def get_platform() -> str:
         else:
             raise RuntimeError(f"Unsupported architecture: {machine}")
 
-        # Detect musl vs glibc
+        # Detect musl vs glibc from the dynamic loader mapped into this process
         try:
-            result = subprocess.run(
-                ["ldd", "--version"],
-                capture_output=True,
-                text=True,
-            )
-            if "musl" in (result.stdout + result.stderr).lower():
+            if "ld-musl" in Path("/proc/self/maps").read_text():
                 return f"linux-{arch}-musl"
-        except FileNotFoundError:
+        except OSError:
             pass
 
         # Check for musl loader
@@ -94,8 +102,8 @@ def try_build_binary_locally(target_dir: Path) -> Optional[Path]:
         raise RuntimeError(f"Cargo build failed: {result.stderr}")
 
     # Find the built binary
-    system = platform.system().lower()
-    binary_name = "pg0.exe" if system == "windows" else "pg0"
+    is_windows = sys.platform == "win32"
+    binary_name = "pg0.exe" if is_windows else "pg0"
     built_binary = repo_root / "target" / "release" / binary_name
 
     if not built_binary.exists():
@@ -107,8 +115,8 @@ def try_build_binary_locally(target_dir: Path) -> Optional[Path]:
     shutil.copy2(built_binary, target_path)
 
     # Make executable on Unix
-    if system != "windows":
-        target_path.chmod(target_path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    if not is_windows:
+        os.chmod(target_path, BINARY_MODE)
 
     print(f"  Built binary copied to: {target_path}")
     return target_path
@@ -128,14 +136,21 @@ def download_binary(target_dir: Path, plat: str, version: str) -> Path:
 
     # Download to temp file first
     tmp_path = binary_path.with_suffix(".tmp")
-    urllib.request.urlretrieve(url, tmp_path)
+    try:
+        if not fetch_ranges(url, tmp_path):
+            with urllib.request.urlopen(url, timeout=120) as response, open(tmp_path, "wb") as f:
+                shutil.copyfileobj(response, f, length=READ_DATA_CHUNK)
+    except BaseException:
+        # A partial file in pg0/bin would be picked up as a wheel artifact
+        tmp_path.unlink(missing_ok=True)
+        raise
 
     # Move to final location
     tmp_path.rename(binary_path)
 
     # Make executable on Unix
     if not plat.startswith("windows"):
-        binary_path.chmod(binary_path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        os.chmod(binary_path, BINARY_MODE)
 
     print(f"  Saved to: {binary_path}")
     return binary_path
@@ -169,8 +184,8 @@ class CustomBuildHook(BuildHookInterface):
 
         root = Path(self.root)
         bin_dir = root / "pg0" / "bin"
-        system = platform.system().lower()
-        ext = ".exe" if system == "windows" else ""
+        is_windows = sys.platform == "win32"
+        ext = ".exe" if is_windows else ""
         binary_path = bin_dir / f"pg0{ext}"
 
         # Check if binary already exists
@@ -184,11 +199,14 @@ class CustomBuildHook(BuildHookInterface):
             print(f"Using pre-built binary from PG0_BINARY_PATH: {src_path}")
             bin_dir.mkdir(parents=True, exist_ok=True)
             shutil.copy2(src_path, binary_path)
-            if system != "windows":
-                binary_path.chmod(binary_path.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+            if not is_windows:
+                os.chmod(binary_path, BINARY_MODE)
         # Option 2: Download from GitHub releases (if PG0_VERSION specified)
         elif os.environ.get("PG0_VERSION"):
             plat = os.environ.get("PG0_TARGET_PLATFORM") or get_platform()
+            if plat == "all":
+                # A wheel carries one platform's binary; "all" is for build_binary.py staging
+                raise RuntimeError("PG0_TARGET_PLATFORM=all cannot be used to build a wheel")
             download_binary(bin_dir, plat, os.environ["PG0_VERSION"])
         # Option 3: Try to build locally from source (if in repo context)
         else:
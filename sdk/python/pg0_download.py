@@ -0,0 +1,68 @@
+"""
+Download helpers shared by build_binary.py and hatch_build.py.
+
+Kept free of Python 3.10+ syntax: the hatch build hook imports this module
+on whatever Python builds the wheel (>=3.8).
+"""
+
+import concurrent.futures
+import shutil
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# Read size for streaming downloads; much larger than urllib's 8 KiB default
+READ_DATA_CHUNK = 128 * 1024
+
+# Large downloads are split into this many parallel HTTP Range requests
+RANGED_DOWNLOAD_PARTS = 4
+RANGED_DOWNLOAD_MIN_SIZE = 8 * 1024 * 1024
+
+
+def fetch_ranges(url: str, dest: Path) -> bool:
+    """Download url into dest using parallel HTTP Range requests.
+
+    Returns False without touching dest if the probe request fails, the
+    server does not serve byte ranges or the file is too small for
+    splitting to pay off.
+    """
+    # Probe with a one-byte ranged GET rather than HEAD: urllib turns a
+    # redirected HEAD (GitHub releases answer with a 302) into a GET of the
+    # whole file. The total size comes back in Content-Range.
+    probe = urllib.request.Request(url, headers={"Range": "bytes=0-0"})
+    try:
+        with urllib.request.urlopen(probe, timeout=120) as response:
+            # Range requests go to the post-redirect URL (the CDN object)
+            final_url = response.geturl()
+            partial = response.status == 206
+            content_range = response.headers.get("Content-Range", "")
+    except (urllib.error.URLError, OSError):
+        # Includes HTTP errors and timeouts; the caller's single-stream
+        # download reports the failure if it persists
+        return False
+    # "bytes 0-0/<size>"; a server without range support answers 200 and
+    # the unread body is dropped with the connection
+    total = content_range.rpartition("/")[2]
+    if not partial or not total.isdigit():
+        return False
+    size = int(total)
+    if size < RANGED_DOWNLOAD_MIN_SIZE:
+        return False
+
+    with open(dest, "wb") as f:
+        f.truncate(size)
+
+    part_size = -(-size // RANGED_DOWNLOAD_PARTS)
+
+    def fetch_part(start: int) -> None:
+        end = min(start + part_size, size) - 1
+        request = urllib.request.Request(final_url, headers={"Range": f"bytes={start}-{end}"})
+        with urllib.request.urlopen(request, timeout=120) as response, open(dest, "r+b") as f:
+            if response.status != 206:
+                raise RuntimeError(f"Server ignored range request for {url}")
+            f.seek(start)
+            shutil.copyfileobj(response, f, length=READ_DATA_CHUNK)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=RANGED_DOWNLOAD_PARTS) as executor:
+        list(executor.map(fetch_part, range(0, size, part_size)))
+    return True
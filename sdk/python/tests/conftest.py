@@ -0,0 +1,26 @@
+"""Shared pytest hooks for the pg0 tests."""
+
+import glob
+import os
+import subprocess
+
+import pg0
+
+
+def pytest_sessionstart(session):
+    """Page in the pg0 and PostgreSQL binaries before the first test runs."""
+    try:
+        binaries = [pg0._find_pg0()]
+    except pg0.Pg0NotFoundError:
+        return
+
+    # PostgreSQL binaries extracted by earlier runs (~/.pg0/installation/<version>/bin)
+    pattern = os.path.join(os.path.expanduser("~"), ".pg0", "installation", "*", "bin")
+    for bin_dir in glob.glob(pattern):
+        binaries += [os.path.join(bin_dir, name) for name in ("postgres", "initdb", "pg_ctl")]
+
+    for binary in binaries:
+        try:
+            subprocess.run([binary, "--version"], capture_output=True, timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            pass
@@ -1,36 +1,278 @@
 """Tests for pg0 Python client."""
 
+import asyncio
+import json
 import os
+import shutil
 import signal
+import socket
 import sys
+import tempfile
 import time
+import uuid
+from urllib.parse import urlsplit
 
 import pytest
 import pg0
 from pg0 import Pg0, InstanceInfo, Pg0AlreadyRunningError, Pg0Error
 
 
+# Under pytest-xdist each worker (gw0, gw1, ...) gets its own instance
+# names and a block of ports, so workers never touch each other's clusters
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+WORKER_INDEX = int(WORKER_ID[2:])
+
 # Use a unique port to avoid conflicts
-TEST_PORT = 15432
-TEST_NAME = "pytest-test"
+TEST_PORT = 15432 + 10 * WORKER_INDEX
+TEST_NAME = f"pytest-test-{WORKER_ID}"
+
+# Instance shared by the tests that only run SQL against it; its port is
+# picked from the free ports when the session starts
+SHARED_NAME = f"pytest-shared-{WORKER_ID}"
+
+# Test data is throwaway, so skip the disk flushes that make it crash-safe
+NO_DURABILITY_CONFIG = {
+    "fsync": "off",
+    "synchronous_commit": "off",
+    "full_page_writes": "off",
+    "wal_level": "minimal",
+    "max_wal_senders": "0",
+    "checkpoint_timeout": "1h",
+}
+
+# Settings for the shared instance; work_mem is checked by test_custom_config
+SHARED_CONFIG = {**NO_DURABILITY_CONFIG, "work_mem": "128MB"}
+
+
+def free_port():
+    """A TCP port that nothing on this machine is listening on right now."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def never_started_name():
+    """A unique instance name that no test ever starts, so it needs no cleanup."""
+    return f"never-started-{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture(scope="session")
+def pg_instance(tmp_path_factory):
+    """Start one instance for the whole session instead of one per test."""
+    # Keep the cluster in RAM where a tmpfs is available
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        base = tempfile.mkdtemp(prefix="pg0-tests-", dir="/dev/shm")
+    else:
+        base = str(tmp_path_factory.mktemp("pg0"))
+
+    if pg0.exists(SHARED_NAME):
+        pg0.drop(SHARED_NAME)
+    pg = Pg0(
+        name=SHARED_NAME,
+        port=free_port(),
+        data_dir=os.path.join(base, "data"),
+        config=SHARED_CONFIG,
+    )
+    pg.start()
+
+    yield pg
+
+    pg.stop()
+    pg.drop()
+    shutil.rmtree(base, ignore_errors=True)
 
 
 @pytest.fixture
-def clean_instance():
+def clean_instance(pg_instance):
+    """The shared instance, with tables created by the test dropped afterwards."""
+    yield pg_instance
+
+    pg_instance.execute("DROP TABLE IF EXISTS test_table, batch_test;")
+
+
+@pytest.fixture(scope="session")
+def db_conn(pg_instance):
+    """One client connection to the shared instance, reused by every test."""
+    psycopg = pytest.importorskip("psycopg")
+    with psycopg.connect(pg_instance.uri, autocommit=True) as conn:
+        yield conn
+
+
+@pytest.fixture
+def db(db_conn):
+    """The shared connection inside a transaction that is rolled back afterwards."""
+    with db_conn.transaction(force_rollback=True):
+        yield db_conn
+
+
+@pytest.fixture
+def fresh_instance():
     """Ensure test instance is dropped before and after test."""
     # Cleanup before - drop to remove any existing data/config
-    pg0.drop(TEST_NAME)
+    if pg0.exists(TEST_NAME):
+        pg0.drop(TEST_NAME)
 
     yield
 
     # Cleanup after
-    pg0.drop(TEST_NAME)
+    if pg0.exists(TEST_NAME):
+        pg0.drop(TEST_NAME)
+
+
+@pytest.fixture
+def started_pg(fresh_instance):
+    """
+    Start Pg0 instances for one test and drop them afterwards.
+
+    Call it like Pg0(); name and port default to the test instance.
+    Teardown runs even if the test fails.
+    """
+    started = []
+
+    def start(**kwargs):
+        kwargs.setdefault("name", TEST_NAME)
+        kwargs.setdefault("port", TEST_PORT)
+        pg = Pg0(**kwargs)
+        # Registered before start() so a failed start is cleaned up too
+        started.append(pg)
+        pg.start()
+        return pg
+
+    yield start
+
+    for pg in started:
+        pg.close()
+        if pg0.exists(pg.name):
+            pg.drop()
+
+
+@pytest.fixture
+def fake_pg0(tmp_path, monkeypatch):
+    """
+    Stand in a shell script for the pg0 binary via PG0_BIN.
+
+    Call it with the script body; it returns the script's path. The binary
+    lookup cache is reset on both sides of the test.
+    """
+    def install(body=""):
+        binary = tmp_path / "pg0"
+        binary.write_text("#!/bin/sh\n" + body)
+        binary.chmod(0o755)
+        monkeypatch.setenv("PG0_BIN", str(binary))
+        pg0._reset_pg0_path()
+        return binary
+
+    yield install
+
+    pg0._reset_pg0_path()
 
 
 class TestPg0:
     """Tests for Pg0 class."""
 
-    def test_start_stop(self, clean_instance):
+    def test_execute_sql(self, clean_instance):
+        """Test executing SQL commands through psql."""
+        # One psql call for the whole script
+        result = clean_instance.execute("""
+            SELECT 1 as num;
+            CREATE TABLE test_table (id serial, name text);
+            INSERT INTO test_table (name) VALUES ('hello');
+            SELECT name FROM test_table;
+        """)
+        assert "num" in result
+        assert "hello" in result
+
+    def test_query_table(self, db):
+        """Test creating and querying a table on the shared instance."""
+        with db.cursor() as cur:
+            cur.execute("SELECT 1")
+            assert cur.fetchone() == (1,)
+
+            cur.execute("CREATE TABLE test_table (id serial, name text)")
+            cur.execute("INSERT INTO test_table (name) VALUES ('hello')")
+            cur.execute("SELECT name FROM test_table")
+            assert cur.fetchall() == [("hello",)]
+
+    def test_config_applied(self, db):
+        """Test that config passed to Pg0 reaches the running server."""
+        with db.cursor() as cur:
+            for key, value in NO_DURABILITY_CONFIG.items():
+                cur.execute(f"SHOW {key}")
+                assert cur.fetchone() == (value,)
+
+    def test_custom_config(self, db):
+        """Test custom Pg0 configuration."""
+        with db.cursor() as cur:
+            cur.execute("SHOW work_mem")
+            assert cur.fetchone()[0] == "128MB"
+
+    def test_execute_many(self, clean_instance):
+        """Test executing several statements over one psql connection."""
+        pg = clean_instance
+
+        result = pg.execute_many([
+            "CREATE TABLE batch_test (id int, name text)",
+            "INSERT INTO batch_test VALUES (1, 'first'), (2, 'second');",
+            "SELECT name FROM batch_test ORDER BY id",
+        ])
+        assert "first" in result
+        assert "second" in result
+
+        # Execution stops at the first failing statement
+        with pytest.raises(Pg0Error):
+            pg.execute_many([
+                "SELECT * FROM missing_table",
+                "INSERT INTO batch_test VALUES (3, 'third')",
+            ])
+        assert "third" not in pg.execute("SELECT name FROM batch_test;")
+
+    def test_custom_credentials(self):
+        """Test custom username, password, database."""
+        pg = Pg0(
+            name=TEST_NAME,
+            port=TEST_PORT,
+            username="testuser",
+            password="testpass",
+            database="testdb",
+        )
+
+        uri = urlsplit(pg.configured_uri)
+        assert uri.scheme == "postgresql"
+        assert uri.username == "testuser"
+        assert uri.password == "testpass"
+        assert uri.port == TEST_PORT
+        assert uri.path.lstrip("/") == "testdb"
+        assert Pg0(name=TEST_NAME).configured_uri is None
+
+    def test_stop_when_not_running(self, monkeypatch):
+        """Test that stopping when not running does not raise error."""
+        pg = Pg0(name=never_started_name(), port=TEST_PORT, info_ttl=60)
+        # Should not raise - stop is idempotent
+        pg.stop()
+
+        # Known to be stopped from a fresh info() result: no pg0 call needed
+        assert pg.info().running is False
+        monkeypatch.setattr(pg0, "_run_pg0", lambda *args, **kwargs: pytest.fail("pg0 was run"))
+        pg.stop()
+
+    def test_info_when_not_running(self):
+        """Test getting info when not running."""
+        pg = Pg0(name=never_started_name(), port=TEST_PORT)
+        info = pg.info()
+
+        assert info.running is False
+        assert info.uri is None
+
+    def test_already_running_error(self, pg_instance):
+        """Test that starting a running instance raises error."""
+        with pytest.raises(Pg0AlreadyRunningError):
+            pg_instance.start()
+
+
+class TestPg0Lifecycle:
+    """Tests that start and stop their own Pg0 instance."""
+
+    def test_start_stop(self, fresh_instance):
         """Test starting and stopping Pg0."""
         pg = Pg0(name=TEST_NAME, port=TEST_PORT)
 
@@ -39,120 +281,79 @@ class TestPg0:
         assert info.running is True
         assert info.port == TEST_PORT
         assert info.uri is not None
-        assert f":{TEST_PORT}/" in info.uri
+        assert urlsplit(info.uri).port == TEST_PORT
+        assert info.uri == pg.configured_uri
+
+        # A fresh object has no cached info and must ask pg0
+        assert Pg0(name=TEST_NAME).running is True
 
         # Stop
-        pg.stop()
-        info = pg.info()
+        info = pg.stop()
         assert info.running is False
+        assert info.port == TEST_PORT
+        assert Pg0(name=TEST_NAME).running is False
+        assert pg0.exists(TEST_NAME)
+
+        pg.drop()
+        assert not pg0.exists(TEST_NAME)
 
-    def test_context_manager(self, clean_instance):
+    def test_context_manager(self, fresh_instance):
         """Test using Pg0 as context manager."""
         with Pg0(name=TEST_NAME, port=TEST_PORT) as pg:
             assert pg.running is True
             assert pg.uri is not None
 
         # Should be stopped after exiting context
-        info = pg0.info(TEST_NAME)
-        assert info.running is False
-
-    def test_execute_sql(self, clean_instance):
-        """Test executing SQL commands."""
-        pg = Pg0(name=TEST_NAME, port=TEST_PORT)
-        pg.start()
-
-        try:
-            # Execute a simple query
-            result = pg.execute("SELECT 1 as num;")
-            assert "1" in result
-
-            # Create and query a table
-            pg.execute("CREATE TABLE test_table (id serial, name text);")
-            pg.execute("INSERT INTO test_table (name) VALUES ('hello');")
-            result = pg.execute("SELECT name FROM test_table;")
-            assert "hello" in result
-        finally:
-            pg.stop()
-
-    def test_custom_credentials(self, clean_instance):
-        """Test custom username, password, database."""
-        pg = Pg0(
-            name=TEST_NAME,
-            port=TEST_PORT,
-            username="testuser",
-            password="testpass",
-            database="testdb",
-        )
-        info = pg.start()
+        assert Pg0(name=TEST_NAME).running is False
 
-        try:
-            assert "testuser" in info.uri
-            assert "testpass" in info.uri
-            assert "testdb" in info.uri
-        finally:
-            pg.stop()
+    def test_persistent_info(self, started_pg):
+        """Test that a persistent Pg0 reports the same info as one-shot calls."""
+        idle = Pg0(name=TEST_NAME, persistent=True)
+        assert idle.running is False
+        idle.close()
 
-    def test_custom_config(self, clean_instance):
-        """Test custom Pg0 configuration."""
-        pg = Pg0(
-            name=TEST_NAME,
-            port=TEST_PORT,
-            config={"work_mem": "128MB"},
-        )
-        pg.start()
+        pg = started_pg(persistent=True)
+        info = pg.info()
+        assert info.running is True
+        assert info.port == TEST_PORT
+        assert info.uri == pg0.info(TEST_NAME).uri
 
-        try:
-            result = pg.execute("SHOW work_mem;")
-            assert "128MB" in result
-        finally:
-            pg.stop()
+        # close() ends the pg0 process; the object keeps working
+        pg.close()
+        pg._info_cache = None
+        assert pg.info().running is True
 
-    def test_already_running_error(self, clean_instance):
-        """Test that starting twice raises error."""
+    def test_async_start_stop(self, fresh_instance):
+        """Test the async start/info/stop variants."""
         pg = Pg0(name=TEST_NAME, port=TEST_PORT)
-        pg.start()
 
-        try:
-            with pytest.raises(Pg0AlreadyRunningError):
-                pg.start()
-        finally:
-            pg.stop()
+        async def scenario():
+            info = await pg.astart()
+            assert info.running is True
+            assert info.port == TEST_PORT
 
-    def test_stop_when_not_running(self, clean_instance):
-        """Test that stopping when not running does not raise error."""
-        pg = Pg0(name=TEST_NAME, port=TEST_PORT)
-        # Should not raise - stop is idempotent
-        pg.stop()
+            infos = await pg0.ainfo_many([TEST_NAME, f"{TEST_NAME}-missing"])
+            assert [i.running for i in infos] == [True, False]
 
-    def test_info_when_not_running(self, clean_instance):
-        """Test getting info when not running."""
-        pg = Pg0(name=TEST_NAME, port=TEST_PORT)
-        info = pg.info()
+            await pg.astop()
+            info = await pg.ainfo()
+            assert info.running is False
 
-        assert info.running is False
-        assert info.uri is None
+        asyncio.run(scenario())
 
-    def test_port_conflict_error(self, clean_instance):
+    def test_port_conflict_error(self, started_pg):
         """Test that starting two instances on the same port gives a readable error."""
-        pg1 = Pg0(name=TEST_NAME, port=TEST_PORT)
-        pg2 = Pg0(name=f"{TEST_NAME}-2", port=TEST_PORT)
+        started_pg()
 
-        pg1.start()
+        with pytest.raises(Pg0Error) as exc_info:
+            started_pg(name=f"{TEST_NAME}-2")
 
-        try:
-            with pytest.raises(Pg0Error) as exc_info:
-                pg2.start()
+        # Verify the error message mentions the port conflict
+        error_message = str(exc_info.value).lower()
+        assert "port" in error_message or "address" in error_message or "in use" in error_message, \
+            f"Error message should mention port conflict, got: {exc_info.value}"
 
-            # Verify the error message mentions the port conflict
-            error_message = str(exc_info.value).lower()
-            assert "port" in error_message or "address" in error_message or "in use" in error_message, \
-                f"Error message should mention port conflict, got: {exc_info.value}"
-        finally:
-            pg1.stop()
-            pg2.stop()
-            pg0.drop(f"{TEST_NAME}-2")
-
-    def test_restart_with_custom_database(self, clean_instance):
+    def test_restart_with_custom_database(self, fresh_instance):
         """Restarting an instance with a non-default database must be idempotent.
 
         Regression test for https://github.com/vectorize-io/pg0/issues/13
@@ -170,7 +371,7 @@ class TestPg0:
         # Second start must succeed and preserve data
         info = pg.start()
         assert info.running is True
-        assert "testdb" in info.uri
+        assert urlsplit(info.uri).path == "/testdb"
         result = pg.execute("SELECT id FROM restart_test;")
         assert "42" in result
         pg.stop()
@@ -179,7 +380,7 @@ class TestPg0:
         sys.platform == "win32",
         reason="signal.SIGKILL does not exist on Windows; crash-recovery behavior is exercised by the Unix matrix.",
     )
-    def test_data_survives_crash(self, clean_instance):
+    def test_data_survives_crash(self, fresh_instance):
         """Test that data is preserved after an unclean shutdown (SIGKILL).
 
         Regression test for https://github.com/vectorize-io/pg0/issues/6
@@ -215,7 +416,7 @@ class TestPg0:
 class TestConvenienceFunctions:
     """Tests for module-level convenience functions."""
 
-    def test_start_stop_info(self, clean_instance):
+    def test_start_stop_info(self, fresh_instance):
         """Test start, stop, info functions."""
         info = pg0.start(name=TEST_NAME, port=TEST_PORT)
         assert info.running is True
@@ -228,68 +429,172 @@ class TestConvenienceFunctions:
         info = pg0.info(TEST_NAME)
         assert info.running is False
 
-    def test_list_instances(self, clean_instance):
+    def test_list_instances(self, pg_instance):
         """Test listing instances."""
-        # Start an instance
-        pg0.start(name=TEST_NAME, port=TEST_PORT)
-
-        try:
-            instances = pg0.list_instances()
-            names = [i.name for i in instances]
-            assert TEST_NAME in names
-        finally:
-            pg0.stop(TEST_NAME)
+        assert any(i.name == pg_instance.name for i in pg0.list_instances())
+        assert pg0.info(pg_instance.name).running is True
 
-    def test_logs(self, clean_instance):
+    def test_logs(self, started_pg):
         """Test getting logs."""
-        pg = Pg0(name=TEST_NAME, port=TEST_PORT)
-        pg.start()
+        pg = started_pg()
 
-        try:
-            # Run a query to generate some log activity
-            pg.execute("SELECT 1;")
+        # Run a query to generate some log activity
+        pg.execute("SELECT 1;")
 
-            # Get logs via instance method
-            logs = pg.logs()
-            assert isinstance(logs, str)
+        # Get logs via instance method
+        logs = pg.logs()
+        assert isinstance(logs, str)
+        assert "ready to accept connections" in logs
 
-            # Get logs with line limit
-            logs_limited = pg.logs(lines=10)
-            assert isinstance(logs_limited, str)
+        # Get logs with line limit
+        logs_limited = pg.logs(lines=10)
+        assert isinstance(logs_limited, str)
 
-            # Get logs via module function
-            logs_module = pg0.logs(TEST_NAME)
-            assert isinstance(logs_module, str)
-        finally:
-            pg.stop()
+        # Stream logs line by line
+        log_lines = list(pg.logs_iter(lines=10))
+        assert 0 < len(log_lines) <= 10
+        assert all(isinstance(line, str) for line in log_lines)
+        assert not log_lines[0].startswith("Logs for instance")
+
+        # Get logs via module function
+        logs_module = pg0.logs(pg.name)
+        assert isinstance(logs_module, str)
+        assert logs_module.strip()
+
+    def test_logs_never_started(self):
+        """Test that logs() returns pg0's output while logs_iter() raises."""
+        name = never_started_name()
+        assert isinstance(pg0.logs(name), str)
+        with pytest.raises(Pg0Error):
+            list(Pg0(name=name).logs_iter())
 
 
 class TestInstanceInfo:
     """Tests for InstanceInfo dataclass."""
 
-    def test_from_dict(self):
+    @pytest.mark.parametrize("data,expected", [
+        pytest.param(
+            {
+                "name": "test",
+                "running": True,
+                "pid": 1234,
+                "port": 5432,
+                "uri": "postgresql://localhost:5432/test",
+            },
+            {
+                "name": "test",
+                "running": True,
+                "pid": 1234,
+                "port": 5432,
+                "uri": "postgresql://localhost:5432/test",
+            },
+            id="full",
+        ),
+        pytest.param(
+            {"running": False},
+            {"name": "default", "running": False, "pid": None, "uri": None},
+            id="minimal",
+        ),
+    ])
+    def test_from_dict(self, data, expected):
         """Test creating InstanceInfo from dict."""
-        data = {
-            "name": "test",
-            "running": True,
-            "pid": 1234,
-            "port": 5432,
-            "uri": "postgresql://localhost:5432/test",
-        }
         info = InstanceInfo.from_dict(data)
 
-        assert info.name == "test"
-        assert info.running is True
-        assert info.pid == 1234
-        assert info.port == 5432
-        assert info.uri == "postgresql://localhost:5432/test"
+        for field, value in expected.items():
+            assert getattr(info, field) == value
+
+        # Slotted on Python 3.10+: no per-instance __dict__
+        if sys.version_info >= (3, 10):
+            assert not hasattr(info, "__dict__")
+
+    def test_decode_json(self):
+        """Test that decoding pg0 JSON output matches from_dict."""
+        raw = b'{"name": "test", "running": true, "port": 5432, "uri": null}'
+        assert pg0._decode_info(raw) == InstanceInfo.from_dict(json.loads(raw))
+        assert pg0._decode_info_list(b"[" + raw + b"]") == [InstanceInfo.from_dict(json.loads(raw))]
+        assert pg0._decode_info(b'{"running": false}') == InstanceInfo("default", False)
+        assert pg0._decode_info_list(b'[{"name": "a"}]') == [InstanceInfo("a", False)]
+
+    def test_name_and_running_required(self):
+        """Test that InstanceInfo does not invent a name or running state."""
+        with pytest.raises(TypeError):
+            InstanceInfo()
+
+
+class TestBinaryLookup:
+    """Tests for locating the pg0 binary."""
+
+    def test_find_pg0_is_cached(self):
+        """Test that the binary path is resolved once and can be reset."""
+        pg0._reset_pg0_path()
+        path = pg0._find_pg0()
+        assert pg0._find_pg0() == path
+        assert pg0._find_pg0.cache_info().hits >= 1
+
+        pg0._reset_pg0_path()
+        assert pg0._find_pg0.cache_info().currsize == 0
+
+    def test_prewarm_does_not_cache(self):
+        """Test that the import-time prewarm leaves the lookup uncached."""
+        pg0._reset_pg0_path()
+        pg0._prewarm_pg0()
+        assert pg0._find_pg0.cache_info().currsize == 0
+
+    def test_pg0_bin_env(self, fake_pg0):
+        """Test that PG0_BIN takes precedence over the lookup ladder."""
+        binary = fake_pg0()
+        assert pg0._find_pg0() == str(binary)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Uses a shell script as a stand-in pg0 binary.")
+    def test_json_command_failure(self, fake_pg0):
+        """Test that a failing JSON command raises pg0's error, not a decode error."""
+        fake_pg0("echo 'Error: state file is corrupt' >&2\nexit 1\n")
+        with pytest.raises(Pg0Error, match="state file is corrupt"):
+            pg0.list_instances()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Uses a shell script as a stand-in pg0 binary.")
+    def test_list_extensions(self, fake_pg0):
+        """Test that only extension names are parsed out of pg0's listing."""
+        fake_pg0(
+            "echo 'Fetching available extensions...'\n"
+            "echo\n"
+            "echo 'Available extensions:'\n"
+            "echo\n"
+            "echo '  pgvecto.rs - Scalable, Low-latency and Hybrid-enabled Vector Search'\n"
+            "echo '  pgvector_compiled - Precompiled OS packages for pgvector'\n"
+        )
+        assert pg0.list_extensions() == ["pgvecto.rs", "pgvector_compiled"]
+        assert pg0.has_extension("pgvector_compiled") is True
+        assert pg0.has_extension("pgvector") is False
+
+    def test_rpc_binary_missing(self, fake_pg0):
+        """Test that a persistent Pg0 reports a vanished binary as Pg0NotFoundError."""
+        binary = fake_pg0()
+        pg0._find_pg0()
+        binary.unlink()
+        pg = Pg0(name=never_started_name(), persistent=True)
+        with pytest.raises(pg0.Pg0NotFoundError):
+            pg.info()
+
+    def test_install_from_url(self, tmp_path, monkeypatch):
+        """Test that install() fetches the binary and makes it executable."""
+        source = tmp_path / "pg0-release"
+        source.write_bytes(b"#!/bin/sh\n")
+        monkeypatch.setenv("PG0_BINARY_URL", source.as_uri())
+
+        binary = pg0.install(install_dir=tmp_path / "bin")
+        try:
+            assert binary.read_bytes() == b"#!/bin/sh\n"
+            if sys.platform != "win32":
+                assert os.access(binary, os.X_OK)
+        finally:
+            pg0._reset_pg0_path()
 
-    def test_from_dict_minimal(self):
-        """Test creating InstanceInfo from minimal dict."""
-        data = {"running": False}
-        info = InstanceInfo.from_dict(data)
+    def test_install_failure_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        """Test that a failed download removes its partial file."""
+        monkeypatch.setenv("PG0_BINARY_URL", (tmp_path / "missing").as_uri())
+        install_dir = tmp_path / "bin"
 
-        assert info.name == "default"
-        assert info.running is False
-        assert info.pid is None
-        assert info.uri is None
+        with pytest.raises(pg0.Pg0NotFoundError):
+            pg0.install(install_dir=install_dir)
+        assert list(install_dir.iterdir()) == []
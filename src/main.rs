@@ -115,6 +115,12 @@ enum Commands {
         #[arg(short, long)]
         force: bool,
     },
+    /// Exit with status 0 if the instance is running, 3 if it is not (like pg_ctl status)
+    Status {
+        /// Instance name
+        #[arg(long, default_value = DEFAULT_INSTANCE_NAME)]
+        name: String,
+    },
     /// Show PostgreSQL server info (status, connection URI, etc.)
     Info {
         /// Instance name
@@ -166,6 +172,10 @@ enum Commands {
     },
     /// List available extensions
     ListExtensions,
+    /// Answer JSON-line requests on stdin/stdout (used by the SDKs to avoid
+    /// starting a new pg0 process per query)
+    #[command(hide = true)]
+    Rpc,
 }
 
 #[derive(Clone, Debug, Default, clap::ValueEnum)]
@@ -207,6 +217,18 @@ struct InfoOutput {
     uri: Option<String>,
 }
 
+/// A single `pg0 rpc` request, e.g. `{"cmd": "info", "name": "default"}`
+#[derive(Deserialize)]
+struct RpcRequest {
+    cmd: String,
+    #[serde(default = "default_instance_name")]
+    name: String,
+}
+
+fn default_instance_name() -> String {
+    DEFAULT_INSTANCE_NAME.to_string()
+}
+
 fn get_base_dir() -> Result<PathBuf, CliError> {
     dirs::home_dir()
         .map(|h| h.join(".pg0"))
@@ -294,6 +316,19 @@ fn is_process_running(pid: u32) -> bool {
     }
 }
 
+/// Wait until a process has exited, checking every 50ms for at most `timeout`.
+/// Returns true if the process is gone.
+fn wait_for_exit(pid: u32, timeout: std::time::Duration) -> bool {
+    let deadline = std::time::Instant::now() + timeout;
+    while is_process_running(pid) {
+        if std::time::Instant::now() >= deadline {
+            return false;
+        }
+        std::thread::sleep(std::time::Duration::from_millis(50));
+    }
+    true
+}
+
 /// Read the PID from PostgreSQL's postmaster.pid file
 fn read_postmaster_pid(data_dir: &PathBuf) -> Result<u32, CliError> {
     let pid_file = data_dir.join("postmaster.pid");
@@ -981,11 +1016,8 @@ fn stop(name: String) -> Result<(), CliError> {
             .output();
     }
 
-    // Wait a bit for graceful shutdown
-    std::thread::sleep(std::time::Duration::from_secs(2));
-
-    // Force kill if still running
-    if is_process_running(info.pid) {
+    // Wait up to 2s for graceful shutdown, force kill if still running
+    if !wait_for_exit(info.pid, std::time::Duration::from_secs(2)) {
         #[cfg(unix)]
         {
             use std::process::Command;
@@ -1050,9 +1082,7 @@ fn drop_instance(name: String, force: bool) -> Result<(), CliError> {
                 .args(["/PID", &info.pid.to_string()])
                 .output();
         }
-        std::thread::sleep(std::time::Duration::from_secs(2));
-
-        if is_process_running(info.pid) {
+        if !wait_for_exit(info.pid, std::time::Duration::from_secs(2)) {
             #[cfg(unix)]
             {
                 use std::process::Command;
@@ -1087,7 +1117,21 @@ fn drop_instance(name: String, force: bool) -> Result<(), CliError> {
     Ok(())
 }
 
-fn info(name: String, output_format: OutputFormat) -> Result<(), CliError> {
+fn status(name: String) -> Result<(), CliError> {
+    let running = match load_instance(&name)? {
+        Some(info) => is_process_running(info.pid),
+        None => false,
+    };
+
+    if !running {
+        process::exit(3);
+    }
+
+    Ok(())
+}
+
+fn instance_info(name: &str) -> Result<InfoOutput, CliError> {
+    let name = name.to_string();
     let instance = load_instance(&name)?;
 
     let output = match instance {
@@ -1140,6 +1184,12 @@ fn info(name: String, output_format: OutputFormat) -> Result<(), CliError> {
         }
     };
 
+    Ok(output)
+}
+
+fn info(name: String, output_format: OutputFormat) -> Result<(), CliError> {
+    let output = instance_info(&name)?;
+
     match output_format {
         OutputFormat::Json => {
             println!("{}", serde_json::to_string_pretty(&output)?);
@@ -1236,8 +1286,12 @@ fn psql(name: String, args: Vec<String>) -> Result<(), CliError> {
 }
 
 fn logs(name: String, lines: Option<usize>, follow: bool) -> Result<(), CliError> {
-    let instance_dir = get_instance_dir(&name)?;
-    let log_dir = instance_dir.join("data").join("log");
+    // Instances started with --data-dir keep their logs there
+    let data_dir = match load_instance(&name)? {
+        Some(info) => info.data_dir,
+        None => get_instance_dir(&name)?.join("data"),
+    };
+    let log_dir = data_dir.join("log");
 
     if !log_dir.exists() {
         return Err(CliError::Other(format!(
@@ -1493,6 +1547,36 @@ fn list_extensions() -> Result<(), CliError> {
     Ok(())
 }
 
+fn rpc() -> Result<(), CliError> {
+    use std::io::{BufRead, Write};
+
+    let stdin = std::io::stdin();
+    let mut stdout = std::io::stdout();
+
+    // One JSON request per line in, one JSON response per line out, until
+    // the client closes stdin. Errors are reported in-band so that a bad
+    // request does not end the session.
+    for line in stdin.lock().lines() {
+        let line = line?;
+        if line.trim().is_empty() {
+            continue;
+        }
+
+        let response = serde_json::from_str::<RpcRequest>(&line)
+            .map_err(CliError::from)
+            .and_then(|request| match request.cmd.as_str() {
+                "info" => serde_json::to_value(instance_info(&request.name)?).map_err(CliError::from),
+                other => Err(CliError::Other(format!("Unknown rpc command '{}'", other))),
+            })
+            .unwrap_or_else(|e| serde_json::json!({ "error": e.to_string() }));
+
+        writeln!(stdout, "{}", response)?;
+        stdout.flush()?;
+    }
+
+    Ok(())
+}
+
 fn init_logging(verbose: bool) {
     let filter = if verbose {
         EnvFilter::new("debug")
@@ -1528,12 +1612,14 @@ fn main() {
         }
         Commands::Stop { name } => stop(name),
         Commands::Drop { name, force } => drop_instance(name, force),
+        Commands::Status { name } => status(name),
         Commands::Info { name, output } => info(name, output),
         Commands::List { output } => list(output),
         Commands::Psql { name, args } => psql(name, args),
         Commands::Logs { name, lines, follow } => logs(name, lines, follow),
         Commands::InstallExtension { name, extension } => install_extension(name, extension),
         Commands::ListExtensions => list_extensions(),
+        Commands::Rpc => rpc(),
     };
 
     if let Err(e) = result {